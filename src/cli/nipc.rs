@@ -14,6 +14,8 @@
 
 mod error;
 
+use std::io::Write;
+
 use nipart::{
     ipc_connect, ipc_exec, NipartApplyOption, NipartIpcMessage,
     NipartQueryOption, NipartState,
@@ -73,7 +75,12 @@ async fn handle_show() {
     .await
     {
         Ok(NipartIpcMessage::QueryStateReply(net_state)) => {
-            println!("{}", serde_yaml::to_string(&net_state).unwrap())
+            // Serialize straight to stdout instead of building a String of
+            // the whole network state first.
+            let stdout = std::io::stdout();
+            let mut stdout = stdout.lock();
+            serde_yaml::to_writer(&mut stdout, &net_state).unwrap();
+            writeln!(stdout).ok();
         }
         Ok(i) => log::error!("Unknown reply: {:?}", i),
         Err(e) => log::error!("{}", e),
@@ -83,20 +90,18 @@ async fn handle_show() {
 async fn handle_apply(file_path: &str) -> Result<(), CliError> {
     let mut connection = ipc_connect().await.unwrap();
     let state = read_state_from_file(file_path)?;
-    match ipc_exec(
-        &mut connection,
-        &NipartIpcMessage::ApplyState(
-            state.clone(),
-            NipartApplyOption::default(),
-        ),
-    )
-    .await
-    {
+    // Keep the state inside the IPC message instead of cloning it, it is
+    // only needed again for the log below when info level is enabled.
+    let ipc_msg =
+        NipartIpcMessage::ApplyState(state, NipartApplyOption::default());
+    match ipc_exec(&mut connection, &ipc_msg).await {
         Ok(NipartIpcMessage::ApplyStateReply) => {
-            log::info!(
-                "State applied\n{}",
-                serde_yaml::to_string(&state).unwrap()
-            );
+            if let NipartIpcMessage::ApplyState(state, _) = &ipc_msg {
+                log::info!(
+                    "State applied\n{}",
+                    serde_yaml::to_string(state).unwrap()
+                );
+            }
             Ok(())
         }
         Ok(i) => Err(format!("Unknown reply: {:?}", i).into()),
@@ -19,7 +19,7 @@ use nipart::{
     NipartApplyOption, NipartError, NipartIpcMessage, NipartPluginCapacity,
     NipartPluginInfo, NipartPluginIpcMessage, NipartQueryOption, NipartState,
 };
-use tokio::{self, io::AsyncWriteExt, net::UnixStream, task};
+use tokio::{io::AsyncWriteExt, net::UnixStream, task};
 
 use crate::plugin::load_plugins;
 
@@ -42,7 +42,6 @@ async fn main() {
     loop {
         match listener.accept().await {
             Ok((stream, _)) => {
-                eprintln!("DEBUG: daemon: IPC client connected");
                 // TODO: Limit the maximum connected client.
                 let plugins_clone = plugins.clone();
                 task::spawn(async move {
@@ -50,7 +49,7 @@ async fn main() {
                 });
             }
             Err(e) => {
-                eprintln!("{}", e);
+                log::error!("{}", e);
             }
         }
     }
@@ -58,7 +57,7 @@ async fn main() {
 
 async fn shutdown_connection(stream: &mut UnixStream) {
     if let Err(e) = stream.shutdown().await {
-        eprintln!("ERROR: Daemon: failed to shutdown a connection: {}", e);
+        log::error!("Failed to shutdown a connection: {}", e);
     }
 }
 
@@ -81,8 +80,8 @@ async fn handle_client(mut stream: UnixStream, plugins: &[NipartPluginInfo]) {
                             handle_apply(&state, plugins, &opt).await
                         }
                         _ => {
-                            eprintln!(
-                                "ERROR: got unknown IPC message: {:?}",
+                            log::error!(
+                                "Got unknown IPC message: {:?}",
                                 &ipc_msg
                             );
                             Ok(NipartIpcMessage::Error(NipartError::new(
@@ -92,11 +91,11 @@ async fn handle_client(mut stream: UnixStream, plugins: &[NipartPluginInfo]) {
                         }
                     });
                 if let Err(e) = ipc_send(&mut stream, &reply_ipc_msg).await {
-                    eprintln!("ERROR: Failed to reply via IPC {}", e);
+                    log::error!("Failed to reply via IPC {}", e);
                 }
             }
             Err(e) => {
-                eprintln!("IPC error {}", e);
+                log::error!("IPC error {}", e);
                 shutdown_connection(&mut stream).await;
                 break;
             }
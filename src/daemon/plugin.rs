@@ -13,7 +13,10 @@
 // limitations under the License.
 
 use std::os::unix::fs::PermissionsExt;
+use std::process::Child;
+use std::time::{Duration, Instant};
 
+use futures::future::join_all;
 use nipart::{
     ipc_connect_with_path, ipc_exec, ErrorKind, NipartError, NipartIpcMessage,
     NipartPluginInfo,
@@ -23,8 +26,9 @@ use tokio::net::UnixStream;
 const PLUGIN_PREFIX: &str = "nipart_plugin_";
 const PLUGIN_SOCKET_PREFIX: &str = "/tmp/nipart_plugin_";
 
-const PLUGIN_CONNECT_REPLY_COUNT: usize = 10;
-const PLUGIN_CONNECT_REPLY_INTERVAL: u64 = 100; // 100ms
+const PLUGIN_CONNECT_TIMEOUT: u64 = 1000; // 1 second
+const PLUGIN_CONNECT_RETRY_INTERVAL_MIN: u64 = 10; // 10ms
+const PLUGIN_CONNECT_RETRY_INTERVAL_MAX: u64 = 200; // 200ms
 
 // Each plugin will be invoked in a thread with a socket path string as its
 // first argument. The plugin should listen on that socket and wait command
@@ -32,7 +36,7 @@ const PLUGIN_CONNECT_REPLY_INTERVAL: u64 = 100; // 100ms
 //
 pub(crate) async fn load_plugins() -> Vec<NipartPluginInfo> {
     log::debug!("Loading plugins");
-    let mut plugins = Vec::new();
+    let mut plugin_candidates: Vec<(String, String)> = Vec::new();
     let search_folder = match std::env::var("NIPART_PLUGIN_FOLDER") {
         Ok(d) => d,
         Err(_) => get_current_exec_folder(),
@@ -41,13 +45,19 @@ pub(crate) async fn load_plugins() -> Vec<NipartPluginInfo> {
     match std::fs::read_dir(&search_folder) {
         Ok(dir) => {
             for entry in dir {
-                let file_name = match entry {
-                    Ok(f) => f.file_name(),
+                let entry = match entry {
+                    Ok(f) => f,
                     Err(e) => {
                         log::error!("Failed to read dir entry: {}", e);
                         continue;
                     }
                 };
+                // The file type is cached from readdir() on Linux, use it to
+                // skip folders without stat() them.
+                if let Ok(true) = entry.file_type().map(|t| t.is_dir()) {
+                    continue;
+                }
+                let file_name = entry.file_name();
                 let file_name = match file_name.to_str() {
                     Some(n) => n,
                     None => {
@@ -74,26 +84,8 @@ pub(crate) async fn load_plugins() -> Vec<NipartPluginInfo> {
                             }
                         };
                     log::debug!("Found plugin {}", &plugin_exec_path);
-                    match plugin_start(&plugin_exec_path, &plugin_name).await {
-                        Ok(plugin) => {
-                            log::debug!(
-                                "Plugin {} started at {} with \
-                                capacities: {:?}",
-                                &plugin.name,
-                                &plugin.socket_path,
-                                &plugin.capacities
-                            );
-                            plugins.push(plugin);
-                        }
-                        Err(e) => {
-                            log::error!(
-                                "Failed to start plugin {}: {}",
-                                &plugin_exec_path,
-                                e
-                            );
-                            continue;
-                        }
-                    }
+                    plugin_candidates
+                        .push((plugin_exec_path, plugin_name.to_string()));
                 }
             }
         }
@@ -101,6 +93,39 @@ pub(crate) async fn load_plugins() -> Vec<NipartPluginInfo> {
             log::error!("Failed to open plugin search dir /usr/bin: {}", e);
         }
     };
+
+    // Plugins are independent from each other, start them concurrently so
+    // the daemon does not wait for each plugin socket in turn.
+    let results = join_all(plugin_candidates.iter().map(
+        |(plugin_exec_path, plugin_name)| {
+            plugin_start(plugin_exec_path, plugin_name)
+        },
+    ))
+    .await;
+
+    let mut plugins = Vec::new();
+    for ((plugin_exec_path, _), result) in
+        plugin_candidates.iter().zip(results.into_iter())
+    {
+        match result {
+            Ok(plugin) => {
+                log::debug!(
+                    "Plugin {} started at {} with capacities: {:?}",
+                    &plugin.name,
+                    &plugin.socket_path,
+                    &plugin.capacities
+                );
+                plugins.push(plugin);
+            }
+            Err(e) => {
+                log::error!(
+                    "Failed to start plugin {}: {}",
+                    plugin_exec_path,
+                    e
+                );
+            }
+        }
+    }
     plugins
 }
 
@@ -114,14 +139,14 @@ async fn plugin_start(
         .arg(&socket_path)
         .spawn()
     {
-        Ok(_) => {
+        Ok(mut child) => {
             log::debug!(
                 "Plugin {} started at {}",
                 plugin_exec_path,
                 &socket_path
             );
 
-            query_plugin_info(&socket_path).await
+            query_plugin_info(&socket_path, &mut child).await
         }
         Err(e) => Err(NipartError::new(
             ErrorKind::PluginError,
@@ -154,9 +179,10 @@ fn get_current_exec_folder() -> String {
 
 async fn query_plugin_info(
     socket_path: &str,
+    child: &mut Child,
 ) -> Result<NipartPluginInfo, NipartError> {
     // Plugin might not ready yet right after started, so retry is required.
-    let mut stream = ipc_connect_with_retry(socket_path).await?;
+    let mut stream = ipc_connect_with_retry(socket_path, child).await?;
     let ipc_msg =
         ipc_exec(&mut stream, &NipartIpcMessage::QueryPluginInfo).await?;
 
@@ -173,14 +199,30 @@ async fn query_plugin_info(
 
 async fn ipc_connect_with_retry(
     socket_path: &str,
+    child: &mut Child,
 ) -> Result<UnixStream, NipartError> {
-    for i in 0..PLUGIN_CONNECT_REPLY_COUNT {
-        std::thread::sleep(std::time::Duration::from_millis(
-            PLUGIN_CONNECT_REPLY_INTERVAL,
-        ));
+    // Plugin socket is normally ready within a few milliseconds, hence
+    // retry with exponential backoff instead of fixed interval.
+    let deadline =
+        Instant::now() + Duration::from_millis(PLUGIN_CONNECT_TIMEOUT);
+    let mut interval = Duration::from_millis(PLUGIN_CONNECT_RETRY_INTERVAL_MIN);
+    loop {
         match ipc_connect_with_path(socket_path).await {
+            Ok(s) => return Ok(s),
             Err(e) => {
-                if i == PLUGIN_CONNECT_REPLY_COUNT - 1 {
+                // No need to wait for the socket of a dead plugin.
+                if let Ok(Some(status)) = child.try_wait() {
+                    return Err(NipartError::new(
+                        ErrorKind::PluginError,
+                        format!(
+                            "Plugin exited with {} before listening on \
+                            IPC socket {}",
+                            status, socket_path
+                        ),
+                    ));
+                }
+                let now = Instant::now();
+                if now >= deadline {
                     return Err(NipartError::new(
                         ErrorKind::PluginError,
                         format!(
@@ -188,21 +230,20 @@ async fn ipc_connect_with_retry(
                             socket_path, e
                         ),
                     ));
-                } else {
-                    log::debug!(
-                        "DEBUG: Failed to connect plugin \
-                        socket_path: {}: {}, retrying",
-                        socket_path,
-                        e
-                    );
-                    continue;
                 }
+                log::debug!(
+                    "DEBUG: Failed to connect plugin \
+                    socket_path: {}: {}, retrying",
+                    socket_path,
+                    e
+                );
+                tokio::time::sleep(std::cmp::min(interval, deadline - now))
+                    .await;
+                interval = std::cmp::min(
+                    interval * 2,
+                    Duration::from_millis(PLUGIN_CONNECT_RETRY_INTERVAL_MAX),
+                );
             }
-            Ok(s) => return Ok(s),
         }
     }
-    Err(NipartError::new(
-        ErrorKind::Bug,
-        "This should never happen in ipc_connect_with_retry".into(),
-    ))
 }
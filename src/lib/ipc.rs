@@ -15,7 +15,6 @@
 use std::fs::remove_file;
 
 use serde::{Deserialize, Serialize};
-use serde_yaml;
 use tokio::io::{AsyncReadExt, AsyncWriteExt};
 use tokio::net::{UnixListener, UnixStream};
 
@@ -93,37 +92,30 @@ pub async fn ipc_send(
     stream: &mut UnixStream,
     message: &NipartIpcMessage,
 ) -> Result<(), NipartError> {
-    let message_string = match serde_yaml::to_string(message) {
-        Ok(s) => s,
-        Err(e) => {
-            let e = NipartError::new(
-                ErrorKind::InvalidArgument,
-                format!(
-                    "Invalid IPC message - failed to serialize {:?}: {}",
-                    &message, e
-                ),
-            );
-            log::error!("{}", e);
-            return Err(e);
-        }
-    };
-    let message_bytes = message_string.as_bytes();
-    if let Err(e) = stream.write_u32(message_bytes.len() as u32).await {
+    // Send the size and data in single write to save a syscall and avoid
+    // the size header being sent as a standalone packet. The message is
+    // serialized straight into the buffer after a placeholder for the size.
+    let mut buffer: Vec<u8> = vec![0u8; 4];
+    if let Err(e) = serde_yaml::to_writer(&mut buffer, message) {
         let e = NipartError::new(
-            ErrorKind::Bug,
+            ErrorKind::InvalidArgument,
             format!(
-                "Failed to write message size {} to socket: {}",
-                message_bytes.len(),
-                e
+                "Invalid IPC message - failed to serialize {:?}: {}",
+                &message, e
             ),
         );
         log::error!("{}", e);
         return Err(e);
-    };
-    if let Err(e) = stream.write_all(message_bytes).await {
+    }
+    let message_size = buffer.len() - 4;
+    buffer[..4].copy_from_slice(&(message_size as u32).to_be_bytes());
+    if let Err(e) = stream.write_all(&buffer).await {
         let e = NipartError::new(
             ErrorKind::Bug,
-            format!("Failed to write message to socket: {}", e),
+            format!(
+                "Failed to write message with size {} to socket: {}",
+                message_size, e
+            ),
         );
         log::error!("{}", e);
         Err(e)
@@ -175,7 +167,7 @@ async fn ipc_recv_get_data(
             ErrorKind::Bug,
             format!("Invalid message recieved: {:?}: {}", buffer, e),
         )),
-        Ok(NipartIpcMessage::Error(e)) => Err(e.clone()),
+        Ok(NipartIpcMessage::Error(e)) => Err(e),
         Ok(m) => Ok(m),
     }
 }
@@ -185,20 +185,20 @@ pub async fn ipc_plugins_exec(
             replys_async.push(ipc_plugin_exec(plugin_info, &ipc_msg));
         }
     }
-    let mut replys = join_all(replys_async).await;
+    let replys = join_all(replys_async).await;
 
-    let mut reply_msgs = Vec::new();
-    for (i, reply) in replys.drain(..).enumerate() {
+    let mut reply_msgs = Vec::with_capacity(replys.len());
+    for (plugin_info, reply) in supported_plugins.iter().zip(replys) {
         reply_msgs.push(match reply {
             Ok(r) => r,
             Err(e) => {
                 // TODO: find
                 log::error!(
                     "Got error from plugin {}: {:?}",
-                    supported_plugins[i].name,
+                    plugin_info.name,
                     e
                 );
-                NipartIpcMessage::Error(e.clone())
+                NipartIpcMessage::Error(e)
             }
         });
     }